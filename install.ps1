@@ -111,8 +111,12 @@ if (-not $BuildExecutable -or $InstallOnly) {
     # Copy files
     Write-Status "Copying application files..."
     
-    if (Test-Path "MouseCoordinateTracker_Windows_Installer\MouseCoordinateTracker.exe") {
-        Copy-Item "MouseCoordinateTracker_Windows_Installer\MouseCoordinateTracker.exe" "$InstallPath\" -Force
+    # Output of scripts\build_windows_installer.py (one-folder build)
+    $AppSource = "dist\MouseCoordinateTracker"
+    
+    if (Test-Path "$AppSource\MouseCoordinateTracker.exe") {
+        # One-folder build: the exe needs the DLLs and data next to it
+        Copy-Item "$AppSource\*" "$InstallPath\" -Recurse -Force
         Copy-Item "README.md" "$InstallPath\" -Force -ErrorAction SilentlyContinue
         
         if (Test-Path "assets") {
@@ -27,17 +27,27 @@ if not exist "%INSTALL_DIR%" mkdir "%INSTALL_DIR%"
 echo ✅ Installation directory: %INSTALL_DIR%
 
 echo [3/4] Copying files...
-copy "MouseCoordinateTracker.exe" "%INSTALL_DIR%\" >nul
-if exist "assets" xcopy "assets" "%INSTALL_DIR%\assets\" /E /I /Q >nul
+robocopy "MouseCoordinateTracker" "%INSTALL_DIR%" /E /MT:8 /NFL /NDL /NJH /NJS /NP /R:1 /W:1 >nul
+REM robocopy exit codes 0-7 mean success
+if errorlevel 8 (
+    echo ❌ Failed to copy application files
+    pause
+    exit /b 1
+)
+if exist "assets" (
+    robocopy "assets" "%INSTALL_DIR%\assets" /E /MT:8 /NFL /NDL /NJH /NJS /NP /R:1 /W:1 >nul
+    if errorlevel 8 (
+        echo ❌ Failed to copy assets
+        pause
+        exit /b 1
+    )
+)
 copy "README.md" "%INSTALL_DIR%\" >nul 2>nul
 
 echo [4/4] Creating shortcuts...
 
-REM Create desktop shortcut
-powershell -Command "& {$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%DESKTOP_SHORTCUT%'); $Shortcut.TargetPath = '%INSTALL_DIR%\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save()}"
-
-REM Create start menu shortcut
-powershell -Command "& {$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%START_MENU%\Mouse Coordinate Tracker.lnk'); $Shortcut.TargetPath = '%INSTALL_DIR%\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save()}"
+REM Create desktop and start menu shortcuts in a single PowerShell session
+powershell -NoProfile -NonInteractive -Command "& {$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%DESKTOP_SHORTCUT%'); $Shortcut.TargetPath = '%INSTALL_DIR%\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save(); $Shortcut = $WshShell.CreateShortcut('%START_MENU%\Mouse Coordinate Tracker.lnk'); $Shortcut.TargetPath = '%INSTALL_DIR%\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save()}"
 
 echo.
 echo ================================================
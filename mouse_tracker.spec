@@ -1,21 +1,26 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import sys
+
 block_cipher = None
+# Strip symbols from bundled binaries (no strip tool on Windows)
+STRIP = not sys.platform.startswith('win')
 
 a = Analysis(
     ['src/mouse_tracker_gui.py'],
     pathex=[],
     binaries=[],
-    datas=[
-        ('assets/*', 'assets'),
-        ('requirements.txt', '.'),
-        ('README.md', '.'),
-    ],
+    datas=[('assets/*', 'assets')],
     hiddenimports=['pynput.keyboard._win32', 'pynput.mouse._win32'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'tkinter', 'unittest', 'test', 'pydoc_data', 'lib2to3',
+        'distutils', 'sqlite3', 'xmlrpc', 'email.test', 'pygments',
+        'notebook', 'IPython', 'matplotlib', 'scipy', 'pandas',
+        'numpy.tests',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -27,17 +32,13 @@ pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='MouseCoordinateTracker',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    strip=STRIP,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     target_arch=None,
@@ -45,4 +46,15 @@ exe = EXE(
     entitlements_file=None,
     icon='assets/mouse_icon.ico',
     version_file='version_info.txt'
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=STRIP,
+    upx=False,
+    upx_exclude=[],
+    name='MouseCoordinateTracker'
 )
\ No newline at end of file
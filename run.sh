@@ -39,7 +39,7 @@ xhost +local: 2>/dev/null || echo "X11 access control setup attempted"
 
 # Check if packages are installed
 echo "📋 Checking dependencies..."
-if ! python -c "import PyQt5, pyautogui, pynput" 2>/dev/null; then
+if ! python -c "import PyQt5, pynput" 2>/dev/null; then
     echo "📦 Installing missing dependencies..."
     pip install -r requirements.txt
 fi
@@ -5,10 +5,35 @@ Creates a standalone executable installer for Windows using PyInstaller
 
 import os
 import sys
+import hashlib
+import mmap
 import subprocess
 import shutil
+import zipfile
 from pathlib import Path
 
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Inputs that determine the PyInstaller output
+BUILD_INPUTS = ["src", "assets", "requirements.txt",
+                "mouse_tracker.spec", "version_info.txt"]
+BUILD_HASH_FILE = "dist/.build_hash"
+APP_DIR = "dist/MouseCoordinateTracker"
+
+def _fast_copy(src, dst):
+    """Copy a file via hardlink, falling back to a byte copy."""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        return shutil.copy2(src, dst)
+
 def install_pyinstaller():
     """Install PyInstaller if not already installed."""
     try:
@@ -18,7 +43,15 @@ def install_pyinstaller():
     except ImportError:
         print("📦 Installing PyInstaller...")
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+            subprocess.check_call(
+                [sys.executable, "-m", "pip", "install",
+                 "--prefer-binary",
+                 "--disable-pip-version-check",
+                 "--no-warn-script-location",
+                 "--quiet",
+                 "pyinstaller"],
+                env={**os.environ, "PIP_NO_INPUT": "1"}
+            )
             print("✅ PyInstaller installed successfully")
             return True
         except subprocess.CalledProcessError:
@@ -30,22 +63,27 @@ def create_spec_file():
     spec_content = """
 # -*- mode: python ; coding: utf-8 -*-
 
+import sys
+
 block_cipher = None
+# Strip symbols from bundled binaries (no strip tool on Windows)
+STRIP = not sys.platform.startswith('win')
 
 a = Analysis(
     ['src/mouse_tracker_gui.py'],
     pathex=[],
     binaries=[],
-    datas=[
-        ('assets/*', 'assets'),
-        ('requirements.txt', '.'),
-        ('README.md', '.'),
-    ],
+    datas=[('assets/*', 'assets')],
     hiddenimports=['pynput.keyboard._win32', 'pynput.mouse._win32'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'tkinter', 'unittest', 'test', 'pydoc_data', 'lib2to3',
+        'distutils', 'sqlite3', 'xmlrpc', 'email.test', 'pygments',
+        'notebook', 'IPython', 'matplotlib', 'scipy', 'pandas',
+        'numpy.tests',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -57,17 +95,13 @@ pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='MouseCoordinateTracker',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    strip=STRIP,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     target_arch=None,
@@ -76,6 +110,17 @@ exe = EXE(
     icon='assets/mouse_icon.ico',
     version_file='version_info.txt'
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=STRIP,
+    upx=False,
+    upx_exclude=[],
+    name='MouseCoordinateTracker'
+)
 """
     
     with open("mouse_tracker.spec", "w") as f:
@@ -125,38 +170,82 @@ VSVersionInfo(
 
 def create_icon():
     """Create or convert icon for Windows executable."""
-    icon_paths = [
-        "assets/mouse_icon_64x64.png",
-        "assets/mouse_icon.svg"
-    ]
-    
-    # Try to convert existing icon to ICO format
-    for icon_path in icon_paths:
-        if os.path.exists(icon_path):
-            try:
-                from PIL import Image
-                if icon_path.endswith('.png'):
-                    img = Image.open(icon_path)
-                    img.save("assets/mouse_icon.ico", format='ICO')
-                    print("✅ Created ICO icon from PNG")
-                    return True
-            except ImportError:
-                print("⚠️ PIL not available for icon conversion")
-                break
-            except Exception as e:
-                print(f"⚠️ Icon conversion failed: {e}")
-                break
-    
-    # Create a simple ICO file if conversion failed
+    ico_path = "assets/mouse_icon.ico"
+    icon_path = "assets/mouse_icon_64x64.png"
+
+    if not os.path.exists(icon_path):
+        print("📝 Using default icon")
+        return False
+
+    # Skip conversion if the ICO is already newer than its source PNG
+    if (os.path.exists(ico_path) and
+            os.path.getmtime(ico_path) >= os.path.getmtime(icon_path)):
+        print("✅ ICO icon is up to date")
+        return True
+
+    if not HAS_PIL:
+        print("⚠️ PIL not available for icon conversion")
+        print("📝 Using default icon")
+        return False
+
+    # Convert existing icon to ICO format
+    try:
+        img = Image.open(icon_path)
+        img.save(ico_path, format='ICO')
+        print("✅ Created ICO icon from PNG")
+        return True
+    except Exception as e:
+        print(f"⚠️ Icon conversion failed: {e}")
+
+    # Fall back to the default icon if conversion failed
     print("📝 Using default icon")
     return False
 
+def _digest(path):
+    """SHA1 of a file, hashed straight from the page cache via mmap."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha1().hexdigest()  # mmap rejects empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha1(mm).hexdigest()
+
+def compute_build_hash():
+    """Fingerprint all build inputs (SHA1 is plenty for change detection)."""
+    h = hashlib.sha1()
+    for input_path in BUILD_INPUTS:
+        if os.path.isdir(input_path):
+            files = []
+            for root, dirs, names in os.walk(input_path):
+                dirs[:] = [d for d in dirs if d != "__pycache__"]
+                files.extend(os.path.join(root, name) for name in names)
+        elif os.path.exists(input_path):
+            files = [input_path]
+        else:
+            continue
+        for file_path in sorted(files):
+            h.update(file_path.encode())
+            h.update(_digest(file_path).encode())
+    return h.hexdigest()
+
+def is_build_cached(build_hash):
+    """Check whether dist/ already holds a build of these exact inputs."""
+    if not os.path.isdir(APP_DIR) or not os.path.exists(BUILD_HASH_FILE):
+        return False
+    with open(BUILD_HASH_FILE) as f:
+        return f.read().strip() == build_hash
+
+def save_build_hash(build_hash):
+    """Record the inputs fingerprint of a successful build."""
+    with open(BUILD_HASH_FILE, "w") as f:
+        f.write(build_hash)
+
 def build_executable():
     """Build the executable using PyInstaller."""
     print("🔨 Building executable...")
     try:
         subprocess.check_call([
-            sys.executable, "-m", "PyInstaller",
+            sys.executable, "-OO",  # drop docstrings/asserts from the PYZ
+            "-m", "PyInstaller",
             "--clean",
             "--noconfirm",
             "mouse_tracker.spec"
@@ -198,17 +287,27 @@ if not exist "%INSTALL_DIR%" mkdir "%INSTALL_DIR%"
 echo ✅ Installation directory: %INSTALL_DIR%
 
 echo [3/4] Copying files...
-copy "MouseCoordinateTracker.exe" "%INSTALL_DIR%\\" >nul
-if exist "assets" xcopy "assets" "%INSTALL_DIR%\\assets\\" /E /I /Q >nul
+robocopy "MouseCoordinateTracker" "%INSTALL_DIR%" /E /MT:8 /NFL /NDL /NJH /NJS /NP /R:1 /W:1 >nul
+REM robocopy exit codes 0-7 mean success
+if errorlevel 8 (
+    echo ❌ Failed to copy application files
+    pause
+    exit /b 1
+)
+if exist "assets" (
+    robocopy "assets" "%INSTALL_DIR%\\assets" /E /MT:8 /NFL /NDL /NJH /NJS /NP /R:1 /W:1 >nul
+    if errorlevel 8 (
+        echo ❌ Failed to copy assets
+        pause
+        exit /b 1
+    )
+)
 copy "README.md" "%INSTALL_DIR%\\" >nul 2>nul
 
 echo [4/4] Creating shortcuts...
 
-REM Create desktop shortcut
-powershell -Command "& {$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%DESKTOP_SHORTCUT%'); $Shortcut.TargetPath = '%INSTALL_DIR%\\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save()}"
-
-REM Create start menu shortcut
-powershell -Command "& {$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%START_MENU%\\Mouse Coordinate Tracker.lnk'); $Shortcut.TargetPath = '%INSTALL_DIR%\\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save()}"
+REM Create desktop and start menu shortcuts in a single PowerShell session
+powershell -NoProfile -NonInteractive -Command "& {$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%DESKTOP_SHORTCUT%'); $Shortcut.TargetPath = '%INSTALL_DIR%\\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save(); $Shortcut = $WshShell.CreateShortcut('%START_MENU%\\Mouse Coordinate Tracker.lnk'); $Shortcut.TargetPath = '%INSTALL_DIR%\\MouseCoordinateTracker.exe'; $Shortcut.WorkingDirectory = '%INSTALL_DIR%'; $Shortcut.Description = 'Track and save mouse coordinates'; $Shortcut.Save()}"
 
 echo.
 echo ================================================
@@ -258,48 +357,71 @@ def main():
     create_version_info()
     create_icon()
     
-    # Build executable
-    if not build_executable():
-        return False
+    # Build executable (skipped when nothing changed since the last build)
+    build_hash = compute_build_hash()
+    if is_build_cached(build_hash):
+        print("✅ Build inputs unchanged, using cached executable")
+    else:
+        # Invalidate first so a failed build never looks cached
+        if os.path.exists(BUILD_HASH_FILE):
+            os.remove(BUILD_HASH_FILE)
+        if not build_executable():
+            return False
+        save_build_hash(build_hash)
     
     # Create installer script
     create_installer_script()
     
-    # Copy executable and create distribution
-    dist_dir = "dist"
-    exe_source = f"{dist_dir}/MouseCoordinateTracker"  # Linux builds without .exe
-    exe_windows = f"{dist_dir}/MouseCoordinateTracker.exe"  # Windows format
-    
+    # Copy application folder and create distribution
+    # (one-folder build: no per-launch extraction to %TEMP%)
+    app_dir = APP_DIR
+    exe_source = f"{app_dir}/MouseCoordinateTracker"  # Linux builds without .exe
+    exe_windows = f"{app_dir}/MouseCoordinateTracker.exe"  # Windows format
+
     # Check for either format
-    if os.path.exists(exe_source):
+    if os.path.exists(exe_source) or os.path.exists(exe_windows):
         # Rename to Windows format if needed
         if not os.path.exists(exe_windows):
-            shutil.copy(exe_source, exe_windows)
+            _fast_copy(exe_source, exe_windows)
             print(f"✅ Copied executable to Windows format: {exe_windows}")
-        
-        # Create installer package
+
+        # Create installer package as a single archive; extracting it
+        # yields the MouseCoordinateTracker_Windows_Installer/ folder
         installer_dir = "MouseCoordinateTracker_Windows_Installer"
-        if os.path.exists(installer_dir):
-            shutil.rmtree(installer_dir)
-        os.makedirs(installer_dir)
-        
-        # Copy files to installer directory
-        shutil.copy(exe_windows, installer_dir)
-        shutil.copy("installer.bat", installer_dir)
-        shutil.copy("README.md", installer_dir)
-        
-        if os.path.exists("assets"):
-            shutil.copytree("assets", f"{installer_dir}/assets")
-        
-        print(f"✅ Installer package created: {installer_dir}/")
-        exe_size = os.path.getsize(exe_windows) / 1024 / 1024
-        print(f"📦 Executable size: {exe_size:.1f} MB")
+        installer_zip = f"{installer_dir}.zip"
+        package_files = [("installer.bat", "installer.bat"),
+                         ("README.md", "README.md")]
+        # The walk adds the .exe; only the extension-less Linux binary is
+        # left out. Compare normalized paths: os.walk joins with "\\" on
+        # Windows.
+        skip_path = os.path.normpath(exe_source)
+        for tree, arc_root in [(app_dir, "MouseCoordinateTracker"), ("assets", "assets")]:
+            for root, _, files in os.walk(tree):
+                for name in files:
+                    file_path = os.path.join(root, name)
+                    if os.path.normpath(file_path) == skip_path:
+                        continue
+                    rel = Path(os.path.relpath(file_path, tree)).as_posix()
+                    package_files.append((file_path, f"{arc_root}/{rel}"))
+
+        with zipfile.ZipFile(installer_zip, "w", zipfile.ZIP_DEFLATED,
+                             compresslevel=1) as zf:
+            for file_path, arcname in package_files:
+                zf.write(file_path, f"{installer_dir}/{arcname}")
+
+        print(f"✅ Installer package created: {installer_zip}")
+        app_size = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(app_dir)
+            for name in files
+        ) / 1024 / 1024
+        print(f"📦 Application size: {app_size:.1f} MB")
         print()
         print("🎉 Windows installer ready!")
-        print(f"   📁 Package location: {installer_dir}/")
-        print(f"   🚀 To install: Run {installer_dir}/installer.bat as Admin")
-        print(f"   📱 Standalone: Use {installer_dir}/MouseCoordinateTracker.exe")
-        
+        print(f"   📁 Package location: {installer_zip}")
+        print(f"   🚀 To install: Extract, then run {installer_dir}/installer.bat as Admin")
+        print(f"   📱 Standalone: Use {installer_dir}/MouseCoordinateTracker/MouseCoordinateTracker.exe")
+
         return True
     else:
         print("❌ Executable not found in dist directory")
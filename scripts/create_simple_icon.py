@@ -2,35 +2,54 @@
 from PIL import Image, ImageDraw
 import os
 
+ICON_PATH = "assets/mouse_icon_64x64.png"
+ICON_SIZE = 64
+SCALE = 4  # Supersampling factor for antialiasing
+
+
+def _box(*coords):
+    """Scale 64x64 design coordinates up to the supersampled canvas."""
+    return [c * SCALE for c in coords]
+
+
 def create_mouse_icon():
+    # Skip regeneration if the icon is newer than this script
+    if (os.path.exists(ICON_PATH) and
+            os.path.getmtime(ICON_PATH) >= os.path.getmtime(__file__)):
+        print(f"✅ Icon up to date: {ICON_PATH}")
+        return
+
     # Create assets directory if it doesn't exist
     os.makedirs("assets", exist_ok=True)
-    
-    # Create a 64x64 image with transparent background
-    img = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
+
+    # Draw at 4x with transparent background, downscaled below
+    img = Image.new('RGBA', (ICON_SIZE * SCALE, ICON_SIZE * SCALE), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
-    
+
     # Draw mouse body (ellipse)
-    draw.ellipse([14, 20, 50, 60], fill=(44, 62, 80), outline=(52, 73, 94))
-    
+    draw.ellipse(_box(14, 20, 50, 60), fill=(44, 62, 80), outline=(52, 73, 94), width=SCALE)
+
     # Draw mouse buttons area
-    draw.ellipse([18, 16, 46, 40], fill=(236, 240, 241), outline=(189, 195, 199))
-    
+    draw.ellipse(_box(18, 16, 46, 40), fill=(236, 240, 241), outline=(189, 195, 199), width=SCALE)
+
     # Draw left button (blue)
-    draw.pieslice([18, 16, 32, 40], 180, 360, fill=(52, 152, 219), outline=(41, 128, 185))
-    
+    draw.pieslice(_box(18, 16, 32, 40), 180, 360, fill=(52, 152, 219), outline=(41, 128, 185), width=SCALE)
+
     # Draw right button (red)
-    draw.pieslice([32, 16, 46, 40], 180, 360, fill=(231, 76, 60), outline=(192, 57, 43))
-    
+    draw.pieslice(_box(32, 16, 46, 40), 180, 360, fill=(231, 76, 60), outline=(192, 57, 43), width=SCALE)
+
     # Draw scroll wheel
-    draw.rectangle([30, 20, 34, 28], fill=(149, 165, 166), outline=(127, 140, 141))
-    
+    draw.rectangle(_box(30, 20, 34, 28), fill=(149, 165, 166), outline=(127, 140, 141), width=SCALE)
+
     # Draw cable
-    draw.arc([28, 50, 36, 64], 0, 180, fill=(52, 73, 94), width=3)
-    
+    draw.arc(_box(28, 50, 36, 64), 0, 180, fill=(52, 73, 94), width=3 * SCALE)
+
+    # Downscale for supersampled antialiasing
+    img = img.resize((ICON_SIZE, ICON_SIZE), Image.LANCZOS)
+
     # Save as PNG
-    img.save("assets/mouse_icon_64x64.png")
-    print("✅ Created basic mouse icon: assets/mouse_icon_64x64.png")
+    img.save(ICON_PATH, optimize=False, compress_level=1)  # fast zlib level
+    print(f"✅ Created basic mouse icon: {ICON_PATH}")
 
 if __name__ == "__main__":
     try:
@@ -5,30 +5,32 @@ Converts SVG icon to PNG formats for GUI use
 """
 
 import os
-from PyQt5.QtGui import QPixmap, QPainter
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtGui import QImage, QPainter
 from PyQt5.QtSvg import QSvgRenderer
-from PyQt5.QtCore import QSize
+from PyQt5.QtCore import QSize, Qt
 
-def create_png_icon(svg_path, png_path, size=(64, 64)):
-    """Convert SVG to PNG with specified size."""
+def render_png_icon(renderer, size=(64, 64)):
+    """Render the parsed SVG into an image of the specified size."""
+    # QImage (unlike QPixmap) may be saved from worker threads
+    image = QImage(QSize(*size), QImage.Format_ARGB32)
+    image.fill(Qt.transparent)  # Fill with transparent background
+
+    # Render SVG to image
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+    return image
+
+def save_png_icon(image, png_path, size=(64, 64)):
+    """Save a rendered icon as PNG."""
     try:
-        # Create SVG renderer
-        renderer = QSvgRenderer(svg_path)
-        
-        # Create pixmap
-        pixmap = QPixmap(QSize(*size))
-        pixmap.fill()  # Fill with transparent background
-        
-        # Render SVG to pixmap
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        
-        # Save as PNG
-        pixmap.save(png_path, "PNG")
+        # Qt maps PNG quality to zlib level as (100 - q) * 9 / 91: 85 -> level 1
+        if not image.save(png_path, "PNG", 85):
+            raise IOError("QImage.save() failed")
         print(f"✅ Created {png_path} ({size[0]}x{size[1]})")
         return True
-        
+
     except Exception as e:
         print(f"❌ Error creating {png_path}: {e}")
         return False
@@ -54,9 +56,22 @@ def main():
         (128, 128), # High DPI
     ]
     
-    for width, height in sizes:
-        png_file = os.path.join(assets_dir, f"mouse_icon_{width}x{height}.png")
-        create_png_icon(svg_file, png_file, (width, height))
+    # Parse the SVG once and reuse the renderer for every size
+    renderer = QSvgRenderer(svg_file)
+    if not renderer.isValid():
+        print(f"❌ Could not parse SVG file: {svg_file}")
+        return
+
+    # Render on this thread, encode/save PNGs in parallel
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = []
+        for width, height in sizes:
+            png_file = os.path.join(assets_dir, f"mouse_icon_{width}x{height}.png")
+            image = render_png_icon(renderer, (width, height))
+            futures.append(executor.submit(save_png_icon, image, png_file,
+                                           (width, height)))
+        for future in futures:
+            future.result()
 
 if __name__ == "__main__":
     main()
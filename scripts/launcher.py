@@ -8,11 +8,16 @@ import os
 import sys
 import subprocess
 
+# Resolve project paths once at import
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+VENV_DIR = os.path.join(BASE_DIR, '..', 'venv')
+VENV_PYTHON = os.path.join(VENV_DIR, 'bin', 'python')
+PYTHON = VENV_PYTHON if os.path.exists(VENV_PYTHON) else sys.executable
+
 
 def check_virtual_env():
     """Check if virtual environment exists and packages are installed"""
-    venv_path = os.path.join(os.path.dirname(__file__), '..', 'venv')
-    if not os.path.exists(venv_path):
+    if not os.path.exists(VENV_DIR):
         print("Virtual environment not found.")
         print("Please run the setup script first:")
         print("  ./scripts/setup.sh")
@@ -20,28 +25,25 @@ def check_virtual_env():
     return True
 
 
+def exec_script(python, script_path):
+    """Replace the launcher process with the target script"""
+    sys.stdout.flush()  # exec discards anything still buffered
+    if os.name == 'nt':
+        # os.execv on Windows spawns a detached child; wait and pass through
+        sys.exit(subprocess.call([python, script_path]))
+    os.execv(python, [python, script_path])
+
+
 def run_gui():
     """Launch the PyQt5 GUI application"""
-    base_dir = os.path.dirname(__file__)
-    script_path = os.path.join(base_dir, '..', 'src', 'mouse_tracker_gui.py')
-    venv_python = os.path.join(base_dir, '..', 'venv', 'bin', 'python')
-    
-    if os.path.exists(venv_python):
-        subprocess.run([venv_python, script_path], check=False)
-    else:
-        subprocess.run([sys.executable, script_path], check=False)
+    script_path = os.path.join(BASE_DIR, '..', 'src', 'mouse_tracker_gui.py')
+    exec_script(PYTHON, script_path)
 
 
 def run_cli():
     """Launch the command-line application"""
-    base_dir = os.path.dirname(__file__)
-    script_path = os.path.join(base_dir, '..', 'src', 'mouse_tracker_cli.py')
-    venv_python = os.path.join(base_dir, '..', 'venv', 'bin', 'python')
-    
-    if os.path.exists(venv_python):
-        subprocess.run([venv_python, script_path], check=False)
-    else:
-        subprocess.run([sys.executable, script_path], check=False)
+    script_path = os.path.join(BASE_DIR, '..', 'src', 'mouse_tracker_cli.py')
+    exec_script(PYTHON, script_path)
 
 
 def main():
@@ -4,9 +4,21 @@ Simple command-line mouse coordinate tracker
 Based on the original script but with improvements
 """
 
-import pyautogui
 import sys
-import time
+from pynput import mouse
+
+# Bound once; on_move runs for every motion event
+_write = sys.stdout.write
+_flush = sys.stdout.flush
+
+
+def on_move(x, y):
+    """Callback for mouse move events"""
+    # Fixed width so '\r' fully overwrites the previous line, including
+    # negative coordinates from monitors left of/above the primary one.
+    # int() because pynput reports floats on macOS.
+    _write(f'\rX: {int(x):5d} Y: {int(y):5d}')
+    _flush()
 
 
 def main():
@@ -14,16 +26,16 @@ def main():
     print('Mouse Coordinate Tracker')
     print('Press Ctrl-C to quit.')
     print('=' * 30)
-    
-    try:
-        while True:
-            x, y = pyautogui.position()
-            position_str = f'X: {str(x).rjust(4)} Y: {str(y).rjust(4)}'
-            print(position_str, end='')
-            print('\b' * len(position_str), end='', flush=True)
-            time.sleep(0.1)  # Small delay to prevent excessive CPU usage
-    except KeyboardInterrupt:
-        print('\nTracking stopped.')
+
+    # Show the starting position; afterwards only movement triggers output
+    on_move(*mouse.Controller().position)
+
+    # Event-driven: the listener thread only wakes up when the mouse moves
+    with mouse.Listener(on_move=on_move) as listener:
+        try:
+            listener.join()
+        except KeyboardInterrupt:
+            print('\nTracking stopped.')
 
 
 if __name__ == "__main__":
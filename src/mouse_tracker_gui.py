@@ -7,15 +7,15 @@ Following UX Design Principles for optimal usability.
 
 import sys
 import os
-import subprocess
-import pyautogui
+import array
 from pynput import mouse
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout,
                              QWidget, QLabel, QPushButton,
                              QCheckBox, QGroupBox, QGridLayout,
-                             QDesktopWidget, QListWidget, QListWidgetItem)
-from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QIcon
+                             QListWidget, QListWidgetItem)
+from PyQt5.QtCore import QTimer, Qt, QObject, QRect, pyqtSignal
+from PyQt5.QtGui import (QFont, QColor, QPainter, QPen, QIcon, QCursor,
+                         QPixmap, QGuiApplication)
 
 # Design System Constants (Following Laws of UX)
 COLORS = {
@@ -99,20 +99,100 @@ BUTTON_STYLES = {
 }
 
 
-def get_stylesheet(style_name):
-    """Generate stylesheet by combining base and specific styles."""
-    return (BUTTON_STYLES['base'] +
-            BUTTON_STYLES[style_name].format(**COLORS))
+# Button rules: the base block for every button, then one block per style
+# selected through the button's "variant" property
+BUTTON_QSS = BUTTON_STYLES['base'].format() + "".join(
+    style.format(**COLORS).replace('QPushButton',
+                                   f'QPushButton[variant="{name}"]')
+    for name, style in BUTTON_STYLES.items() if name != 'base'
+)
+
+
+# Precomputed widget stylesheets (formatted once, not per state change)
+WINDOW_STYLE = f"background-color: {COLORS['background']};"
+
+COORD_LABEL_STYLE = f"""
+    color: {COLORS['primary']};
+    background-color: #FFFFFF;
+    border: 1px solid {COLORS['border']};
+    border-radius: 4px;
+    padding: {SPACING['xs']}px {SPACING['sm']}px;
+"""
+
+STATUS_LABEL_STYLE = f"""
+    color: {COLORS['text_secondary']};
+    padding: {SPACING['sm']}px;
+    background-color: {COLORS['surface']};
+    border-radius: 4px;
+    border-left: 3px solid {COLORS['primary']};
+"""
+
+# Accent colors the status label is shown in; update_status() falls back
+# to 'primary' for any other name
+STATUS_STATES = ('primary', 'secondary', 'danger')
+
+# Status label style per state
+STATUS_STYLES = {
+    name: f"""
+    color: {COLORS['text_primary']};
+    padding: {SPACING['sm']}px;
+    background-color: {COLORS['surface']};
+    border-radius: 4px;
+    border-left: 3px solid {COLORS[name]};
+"""
+    for name in STATUS_STATES
+}
+
+# Whole-application stylesheet, parsed once by Qt and applied in main().
+# Widgets are matched by object name and switch looks via properties.
+APP_STYLESHEET = (
+    f"QMainWindow, QMainWindow QWidget {{ {WINDOW_STYLE} }}\n"
+    f"QLabel#coordValue {{ {COORD_LABEL_STYLE} }}\n"
+    f"QLabel#status {{ {STATUS_LABEL_STYLE} }}\n"
+    + "".join(f'QLabel#status[state="{name}"] {{ {style} }}\n'
+              for name, style in STATUS_STYLES.items())
+    + "QListWidget { border-radius: 4px; }\n"
+    + BUTTON_QSS
+)
+
+
+def set_style_property(widget, name, value):
+    """Set a property used by a stylesheet selector and re-polish."""
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+# QFont objects built on first use (needs a QApplication) and then shared
+_FONT_CACHE = {}
+
+
+def _font(key):
+    """Return the shared QFont for a FONTS key."""
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = QFont(*FONTS[key])
+        if key == 'coordinate':
+            # Digits only, no complex text shaping needed
+            font.setStyleStrategy(QFont.PreferNoShaping)
+    return font
 
 
 def check_display_environment():
     """Check and fix common display issues."""
-    if 'DISPLAY' not in os.environ:
+    defaulted = 'DISPLAY' not in os.environ
+    if defaulted:
         os.environ['DISPLAY'] = ':0'
-    try:
-        os.system('xhost +local: 2>/dev/null')
-    except Exception:
-        pass
+    # Only open X access when DISPLAY had to be guessed, or on request
+    if defaulted or os.environ.get('MOUSE_TRACKER_XHOST') == '1':
+        import subprocess  # Only needed on this path
+        try:
+            # Exec xhost directly, no /bin/sh in between
+            subprocess.run(['xhost', '+local:'],
+                           stderr=subprocess.DEVNULL, check=False)
+        except OSError:
+            pass  # xhost not installed
 
 
 class HighlightOverlay(QWidget):
@@ -125,55 +205,117 @@ class HighlightOverlay(QWidget):
         )
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        # Don't erase the widget before each paint, and don't steal focus
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+        self.setAttribute(Qt.WA_ShowWithoutActivating, True)
         self.highlight_size = 50
         self.highlight_color = QColor(255, 0, 0, 150)
+        self._pen = QPen(self.highlight_color, 3)
+        self._cache = None  # Pre-rendered ring + crosshair
+        self._update_geometry()
+        self.resize(self.highlight_size, self.highlight_size)
 
     def set_highlight_size(self, size):
         """Set the size of the highlight circle."""
+        if size == self.highlight_size:
+            return
         self.highlight_size = size
+        self._cache = None
+        self._update_geometry()
+        self.resize(size, size)
+        self.update()
+
+    def _update_geometry(self):
+        """Compute the ring rectangle and center for the current size."""
+        size = self.highlight_size
+        self._half = size // 2
+        self._rect = QRect(0, 0, size, size).adjusted(1, 1, -1, -1)
+        self._center = self._rect.center()
 
     def update_position(self, x, y):
         """Update the overlay position to center on mouse coordinates."""
-        half_size = self.highlight_size // 2
-        self.setGeometry(x - half_size, y - half_size,
-                         self.highlight_size, self.highlight_size)
-        self.update()
-
-    def paintEvent(self, event):
-        """Draw the highlight circle."""
-        painter = QPainter(self)
+        # Content is unchanged by a move, so no repaint is requested
+        half_size = self._half
+        self.move(x - half_size, y - half_size)
+
+    def _render_cache(self):
+        """Render the highlight circle once into a transparent pixmap."""
+        size = self.highlight_size
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        pen = QPen(self.highlight_color, 3)
-        painter.setPen(pen)
+        painter.setPen(self._pen)
         # Draw circle in the center of the widget
-        rect = self.rect().adjusted(1, 1, -1, -1)
-        painter.drawEllipse(rect)
+        painter.drawEllipse(self._rect)
         # Draw crosshair
-        center = rect.center()
+        center = self._center
         painter.drawLine(center.x() - 5, center.y(),
                          center.x() + 5, center.y())
         painter.drawLine(center.x(), center.y() - 5,
                          center.x(), center.y() + 5)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        """Draw the highlight circle from the cached pixmap."""
+        if self._cache is None:
+            self._cache = self._render_cache()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
 
 
-class MouseListener(QThread):
-    """A QThread that listens for global mouse clicks using pynput."""
+class MouseBridge(QObject):
+    """Forwards global pynput mouse events to the GUI thread as signals."""
     right_clicked = pyqtSignal(int, int)
+    moved = pyqtSignal(int, int)
 
     def __init__(self):
         super().__init__()
         self.listener = None
-
-    def run(self):
-        """Start the mouse listener."""
-        self.listener = mouse.Listener(on_click=self.on_click)
-        self.listener.start()
-        self.listener.join()  # Block until listener stops
+        self.track_moves = False
+        # Set while a moved signal is queued; cleared by the GUI thread
+        self.move_pending = False
+        self._right_button = mouse.Button.right
+
+    def start(self):
+        """Start the mouse listener; return False if it isn't running."""
+        # pynput runs its own thread; signals emitted there arrive queued
+        try:
+            listener = mouse.Listener(on_click=self.on_click,
+                                      on_move=self.on_move)
+            listener.start()
+            # Listener.wait() never returns if the thread dies during setup
+            # (Wayland, no XRecord, no accessibility permission)
+            with listener._condition:
+                listener._condition.wait_for(
+                    lambda: listener._ready or not listener.is_alive(),
+                    timeout=1.0)
+        except Exception as e:
+            print(f"Warning: mouse listener unavailable: {e}")
+            return False
+        self.listener = listener
+        return self.is_alive()
+
+    def is_alive(self):
+        """Return True while the listener thread is delivering events."""
+        return self.listener is not None and self.listener.is_alive()
+
+    def on_move(self, x, y):
+        """Callback for mouse move events."""
+        # Drop moves while one is still queued: the GUI reads the latest
+        # position from QCursor when it handles the queued one.
+        if self.track_moves and not self.move_pending:
+            self.move_pending = True
+            self.moved.emit(int(x), int(y))
 
     def on_click(self, x, y, button, pressed):
         """Callback for mouse click events."""
-        if button == mouse.Button.right and pressed:
-            self.right_clicked.emit(x, y)
+        # Releases are half of all events: test the bool first
+        if not pressed or button is not self._right_button:
+            return
+        self.right_clicked.emit(int(x), int(y))
 
     def stop(self):
         """Stop the mouse listener."""
@@ -191,21 +333,49 @@ class MouseCoordinateTracker(QMainWindow):
         self.tracking_enabled = False
         self.highlight_enabled = False
         self.overlay = HighlightOverlay()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_coordinates)
-
-        # Setup mouse listener thread
-        self.mouse_listener = MouseListener()
+        self._overlay_shown = False
+        # UI writes batched into one flush per event-loop pass
+        self._pending_updates = {}
+        self._flush_scheduled = False
+        self._status_state = None
+        # One restartable timer for the delayed status reset
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.setTimerType(Qt.VeryCoarseTimer)  # 3 s, ±1 s is fine
+        self._reset_timer.timeout.connect(self.reset_status)
+        self._clipboard = QApplication.clipboard()
+        # Polls QCursor when the pynput listener isn't running
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(50)
+        self._poll_timer.timeout.connect(self.update_coordinates)
+        # While tracking, checks that the listener thread is still alive
+        self._listener_check = QTimer(self)
+        self._listener_check.setInterval(1000)
+        self._listener_check.setTimerType(Qt.VeryCoarseTimer)
+        self._listener_check.timeout.connect(self._check_listener)
+
+        # Usable primary screen area (minus taskbars), cached for centering
+        self._screen_geometry = (QGuiApplication.primaryScreen()
+                                 .availableGeometry())
+        self._coord_text = None  # (x, y, "x, y") built on first copy
+
+        # Saved coordinates as raw ints; the list widget is display only
+        self.saved_x = array.array('i')
+        self.saved_y = array.array('i')
+
+        # Setup global mouse listener
+        self.mouse_listener = MouseBridge()
         self.mouse_listener.right_clicked.connect(self.add_saved_coordinate)
-        self.mouse_listener.start()
+        self.mouse_listener.moved.connect(self.on_mouse_moved,
+                                          Qt.QueuedConnection)
+        if not self.mouse_listener.start():
+            print("Warning: mouse listener not running, polling the cursor")
 
         self.init_ui()
-        self.setup_timer()
 
     def init_ui(self):
         """Initialize the user interface following UX design principles."""
         self.setWindowTitle("Mouse Coordinate Tracker")
-        self.setStyleSheet(f"background-color: {COLORS['background']};")
         
         # Set application icon
         self.set_window_icon()
@@ -219,7 +389,7 @@ class MouseCoordinateTracker(QMainWindow):
 
         # Title
         title_label = QLabel("Mouse Coordinate Tracker")
-        title_label.setFont(QFont(*FONTS['heading']))
+        title_label.setFont(_font('heading'))
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
 
@@ -281,11 +451,11 @@ class MouseCoordinateTracker(QMainWindow):
         control_layout.setSpacing(SPACING['sm'])
 
         self.start_button = QPushButton("Start Tracking")
-        self.start_button.setStyleSheet(get_stylesheet('success'))
+        self.start_button.setProperty('variant', 'success')
         self.start_button.clicked.connect(self.toggle_tracking)
 
         self.copy_button = QPushButton("Copy Coordinates")
-        self.copy_button.setStyleSheet(get_stylesheet('secondary'))
+        self.copy_button.setProperty('variant', 'secondary')
         self.copy_button.clicked.connect(self.copy_coordinates)
 
         self.highlight_checkbox = QCheckBox("Enable Highlight")
@@ -304,19 +474,18 @@ class MouseCoordinateTracker(QMainWindow):
         layout.setSpacing(SPACING['sm'])
 
         self.saved_coords_list = QListWidget()
-        self.saved_coords_list.setStyleSheet("border-radius: 4px;")
 
         copy_selected_button = QPushButton("Copy Selected")
-        copy_selected_button.setStyleSheet(get_stylesheet('secondary'))
+        copy_selected_button.setProperty('variant', 'secondary')
         copy_selected_button.clicked.connect(self.copy_selected_coordinate)
 
         copy_all_button = QPushButton("Copy All")
-        copy_all_button.setStyleSheet(get_stylesheet('secondary'))
+        copy_all_button.setProperty('variant', 'secondary')
         copy_all_button.clicked.connect(self.copy_all_coordinates)
 
         clear_button = QPushButton("Clear List")
-        clear_button.setStyleSheet(get_stylesheet('danger'))
-        clear_button.clicked.connect(self.saved_coords_list.clear)
+        clear_button.setProperty('variant', 'danger')
+        clear_button.clicked.connect(self.clear_saved_coordinates)
 
         layout.addWidget(self.saved_coords_list, 0, 0, 1, 3)
         layout.addWidget(copy_selected_button, 1, 0)
@@ -328,46 +497,30 @@ class MouseCoordinateTracker(QMainWindow):
     def create_coord_label(self):
         """Create a styled label for displaying coordinates."""
         label = QLabel("0")
-        label.setFont(QFont(*FONTS['coordinate']))
+        label.setFont(_font('coordinate'))
         label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet(f"""
-            color: {COLORS['primary']};
-            background-color: #FFFFFF;
-            border: 1px solid {COLORS['border']};
-            border-radius: 4px;
-            padding: {SPACING['xs']}px {SPACING['sm']}px;
-        """)
+        label.setObjectName('coordValue')
         return label
 
     def create_status_label(self):
         """Create the styled status label."""
         status_label = QLabel("Ready to track mouse coordinates")
-        status_font = QFont(*FONTS['status'])
+        status_font = QFont(_font('status'))
         status_font.setItalic(True)
         status_label.setFont(status_font)
-        status_label.setStyleSheet(f"""
-            color: {COLORS['text_secondary']};
-            padding: {SPACING['sm']}px;
-            background-color: {COLORS['surface']};
-            border-radius: 4px;
-            border-left: 3px solid {COLORS['primary']};
-        """)
+        status_label.setObjectName('status')
         return status_label
 
     def center_window(self):
         """Center the window on the screen."""
         self.adjustSize()  # Let PyQt calculate the optimal size
-        screen = QDesktopWidget().screenGeometry()
+        screen = self._screen_geometry
         size = self.geometry()
         self.move(
-            (screen.width() - size.width()) // 2,
-            (screen.height() - size.height()) // 2
+            screen.x() + (screen.width() - size.width()) // 2,
+            screen.y() + (screen.height() - size.height()) // 2
         )
 
-    def setup_timer(self):
-        """Setup the timer with initial interval."""
-        self.timer.setInterval(50)
-
     def toggle_tracking(self):
         """Start or stop coordinate tracking."""
         if self.tracking_enabled:
@@ -377,20 +530,36 @@ class MouseCoordinateTracker(QMainWindow):
 
     def start_tracking(self):
         """Start tracking mouse coordinates with visual feedback."""
+        # Validate cursor access once here instead of guarding every update
+        try:
+            QCursor.pos()
+        except Exception as e:
+            self.update_status(f"Error: {e}", 'danger')
+            return
         self.tracking_enabled = True
-        self.timer.start()
+        # Bind the per-update callables once instead of on every move
+        self._set_x = self.x_label.setNum
+        self._set_y = self.y_label.setNum
+        self._move_overlay = self.overlay.update_position
+        self.mouse_listener.track_moves = True
+        self.update_coordinates()
         self.start_button.setText("Stop Tracking")
-        self.start_button.setStyleSheet(get_stylesheet('danger'))
+        set_style_property(self.start_button, 'variant', 'danger')
         self.update_status("🔴 Tracking mouse coordinates...", 'secondary')
+        self._listener_check.start()
+        self._check_listener()
 
     def stop_tracking(self):
         """Stop tracking mouse coordinates."""
         self.tracking_enabled = False
-        self.timer.stop()
+        self.mouse_listener.track_moves = False
+        self._listener_check.stop()
+        self._poll_timer.stop()
         if self.highlight_enabled:
             self.overlay.hide()
+            self._overlay_shown = False
         self.start_button.setText("Start Tracking")
-        self.start_button.setStyleSheet(get_stylesheet('success'))
+        set_style_property(self.start_button, 'variant', 'success')
         self.update_status("⏹️ Tracking stopped.", 'primary')
 
     def toggle_highlight(self, checked):
@@ -398,29 +567,77 @@ class MouseCoordinateTracker(QMainWindow):
         self.highlight_enabled = checked
         if not checked:
             self.overlay.hide()
+            self._overlay_shown = False
         elif self.tracking_enabled:
-            self.overlay.show()
+            self.update_coordinates()
+
+    def _check_listener(self):
+        """Fall back to polling QCursor once the listener has died."""
+        if self.mouse_listener.is_alive():
+            return
+        self._listener_check.stop()
+        self._poll_timer.start()
+        self.update_status("⚠️ Mouse listener unavailable: polling, "
+                           "right-click saving disabled.", 'danger')
+
+    def on_mouse_moved(self, x, y):
+        """Coalesce global mouse moves into one update per event-loop pass."""
+        self.mouse_listener.move_pending = False
+        self._pending_updates["coord"] = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Arm a single zero-delay flush of pending UI updates."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_updates)
+
+    def _flush_updates(self):
+        """Apply each pending UI update once."""
+        self._flush_scheduled = False
+        pending, self._pending_updates = self._pending_updates, {}
+        if pending.get("coord"):
+            self.update_coordinates()
+        status = pending.get("status")
+        if status is not None:
+            text, state = status
+            self.status_label.setText(text)
+            # Re-polish only when the accent actually changes
+            if state != self._status_state:
+                set_style_property(self.status_label, 'state', state)
+                self._status_state = state
 
     def update_coordinates(self):
         """Update the displayed coordinates."""
-        try:
-            x, y = pyautogui.position()
-            self.current_x, self.current_y = x, y
-            self.x_label.setText(str(x))
-            self.y_label.setText(str(y))
-            if self.highlight_enabled:
-                if not self.overlay.isVisible():
-                    self.overlay.show()
-                self.overlay.update_position(x, y)
-        except Exception as e:
-            self.update_status(f"Error: {e}", 'danger')
+        if not self.tracking_enabled:
+            return
+        pos = QCursor.pos()
+        x, y = pos.x(), pos.y()
+        # Show outside the change gate so enabling highlight while the
+        # cursor is idle still displays the overlay
+        if self.highlight_enabled and not self._overlay_shown:
+            self.overlay.update_position(x, y)
+            self.overlay.show()
+            self._overlay_shown = True
+        if x == self.current_x and y == self.current_y:
+            return
+        self.current_x, self.current_y = x, y
+        # setNum formats the int in C++, no Python str per update
+        self._set_x(x)
+        self._set_y(y)
+        if self.highlight_enabled:
+            self._move_overlay(x, y)
 
     def copy_coordinates(self):
         """Copy current coordinates to clipboard with feedback."""
-        coords_text = f"{self.current_x}, {self.current_y}"
-        QApplication.clipboard().setText(coords_text)
+        x, y = self.current_x, self.current_y
+        cached = self._coord_text
+        if cached is None or cached[0] != x or cached[1] != y:
+            cached = self._coord_text = (x, y, f"{x}, {y}")
+        coords_text = cached[2]
+        self._clipboard.setText(coords_text)
         self.update_status(f"📋 Copied: {coords_text}", 'success')
-        QTimer.singleShot(3000, self.reset_status)
+        self._reset_timer.start(3000)
 
     def reset_status(self):
         """Reset status to its default state based on tracking status."""
@@ -431,55 +648,56 @@ class MouseCoordinateTracker(QMainWindow):
 
     def update_status(self, text, style_color_name):
         """Update the status label's text and style."""
-        color = COLORS.get(style_color_name, COLORS['primary'])
-        self.status_label.setText(text)
-        self.status_label.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            padding: {SPACING['sm']}px;
-            background-color: {COLORS['surface']};
-            border-radius: 4px;
-            border-left: 3px solid {color};
-        """)
+        if style_color_name not in STATUS_STYLES:
+            style_color_name = 'primary'
+        self._pending_updates["status"] = (text, style_color_name)
+        self._schedule_flush()
 
     def add_saved_coordinate(self, x, y):
         """Add the given coordinates to the saved list."""
         if self.tracking_enabled:
+            self.saved_x.append(x)
+            self.saved_y.append(y)
             coord_text = f"X: {x}, Y: {y}"
             self.saved_coords_list.addItem(QListWidgetItem(coord_text))
             self.update_status(f"💾 Saved: {coord_text}", 'primary')
-            QTimer.singleShot(3000, self.reset_status)
+            self._reset_timer.start(3000)
 
     def copy_selected_coordinate(self):
         """Copy the selected coordinate from the list."""
         selected_items = self.saved_coords_list.selectedItems()
         if not selected_items:
             self.update_status("⚠️ No coordinate selected to copy.", 'danger')
-            QTimer.singleShot(3000, self.reset_status)
+            self._reset_timer.start(3000)
             return
 
         coord_text = selected_items[0].text()
-        QApplication.clipboard().setText(coord_text)
+        self._clipboard.setText(coord_text)
         self.update_status(f"📋 Copied selected: {coord_text}", 'success')
-        QTimer.singleShot(3000, self.reset_status)
+        self._reset_timer.start(3000)
 
     def copy_all_coordinates(self):
         """Copy all saved coordinates to the clipboard."""
-        if self.saved_coords_list.count() == 0:
+        if not self.saved_x:
             self.update_status("⚠️ No coordinates to copy.", 'danger')
-            QTimer.singleShot(3000, self.reset_status)
+            self._reset_timer.start(3000)
             return
 
-        all_coords = [self.saved_coords_list.item(i).text()
-                      for i in range(self.saved_coords_list.count())]
-        clipboard_text = "\n".join(all_coords)
-        QApplication.clipboard().setText(clipboard_text)
+        clipboard_text = "\n".join(
+            f"X: {x}, Y: {y}" for x, y in zip(self.saved_x, self.saved_y))
+        self._clipboard.setText(clipboard_text)
         self.update_status("📋 Copied all saved coordinates.", 'success')
-        QTimer.singleShot(3000, self.reset_status)
+        self._reset_timer.start(3000)
+
+    def clear_saved_coordinates(self):
+        """Clear the saved coordinates and their list view."""
+        del self.saved_x[:]
+        del self.saved_y[:]
+        self.saved_coords_list.clear()
 
     def closeEvent(self, event):
         """Handle application close event."""
         self.mouse_listener.stop()
-        self.timer.stop()
         self.overlay.close()
         event.accept()
 
@@ -487,11 +705,11 @@ class MouseCoordinateTracker(QMainWindow):
 def main():
     """Main application entry point."""
     check_display_environment()
-    pyautogui.FAILSAFE = False
 
     try:
         app = QApplication(sys.argv)
         app.setStyle('Fusion')
+        app.setStyleSheet(APP_STYLESHEET)
         window = MouseCoordinateTracker()
         window.show()
         print("✅ GUI Application started successfully!")
@@ -499,6 +717,7 @@ def main():
     except Exception as e:
         print(f"❌ Error starting GUI application: {e}")
         print("\n💡 Falling back to command-line version...")
+        import subprocess
         try:
             subprocess.run([sys.executable, "src/mouse_tracker_cli.py"],
                            check=True)
@@ -8,52 +8,84 @@ Includes better error handling for display and permission issues.
 import sys
 import os
 import time
+import importlib.util
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QLabel, QPushButton, QCheckBox, QSpinBox,
                              QGroupBox, QGridLayout, QMessageBox, QTextEdit)
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QPen
-from PyQt5.QtWidgets import QDesktopWidget
+from PyQt5.QtCore import QTimer, Qt, QRect, pyqtSignal
+from PyQt5.QtGui import (QFont, QPalette, QColor, QPainter, QPen, QPainterPath,
+                         QPixmap, QGuiApplication, QCursor)
 
-# Try different mouse libraries for better compatibility
+# Try different mouse libraries for better compatibility.
+# pynput is preferred: pyautogui pulls in Pillow, pyscreeze, pymsgbox etc.
+# at import time, so it is only located here and imported on first use.
+# Neither is required for the GUI, which can read the cursor through Qt.
 MOUSE_LIB = None
 try:
-    import pyautogui
-    MOUSE_LIB = 'pyautogui'
-    # Disable fail-safe for better user experience
-    pyautogui.FAILSAFE = False
+    from pynput import mouse
+    MOUSE_LIB = 'pynput'
 except Exception as e:
-    try:
-        from pynput import mouse
-        MOUSE_LIB = 'pynput'
-    except Exception as e2:
-        print(f"Error importing mouse libraries:")
-        print(f"  pyautogui: {e}")
-        print(f"  pynput: {e2}")
-        print("Please install required packages: pip install pyautogui pynput")
-        sys.exit(1)
+    if importlib.util.find_spec('pyautogui') is not None:
+        MOUSE_LIB = 'pyautogui'
+    else:
+        print(f"Warning: pynput not available ({e}); polling the cursor through Qt")
+
+# Shared by the X and Y coordinate labels
+COORD_LABEL_STYLE = "color: blue; background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc;"
+
+# Start/stop button looks, swapped when tracking is toggled
+START_BUTTON_STYLE = "QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 8px; }"
+STOP_BUTTON_STYLE = "QPushButton { background-color: #f44336; color: white; font-weight: bold; padding: 8px; }"
+
+
+def _qcursor_position():
+    """Cursor position from Qt's own display connection"""
+    pos = QCursor.pos()
+    return pos.x(), pos.y()
+
+
+def _resolve_position_fn():
+    """Pick the position source once and bind it to _pos_fn"""
+    global _pos_fn, _POS_SOURCE
+    if QGuiApplication.instance() is not None:
+        # Native XQueryPointer/GetCursorPos on Qt's already-open connection
+        _pos_fn = _qcursor_position
+        _POS_SOURCE = 'Qt (QCursor)'
+    elif MOUSE_LIB == 'pyautogui':
+        import pyautogui
+        # Disable fail-safe for better user experience
+        pyautogui.FAILSAFE = False
+        _pos_fn = pyautogui.position
+        _POS_SOURCE = 'pyautogui'
+    elif MOUSE_LIB == 'pynput':
+        controller = mouse.Controller()  # One instance, reused per sample
+        _pos_fn = lambda: controller.position
+        _POS_SOURCE = 'pynput'
+    else:
+        raise RuntimeError("No mouse library available: pip install pynput")
+
+
+def _first_position():
+    """Resolve the position source on first use, then read from it"""
+    _resolve_position_fn()
+    return _pos_fn()
+
+
+# Rebound by _resolve_position_fn, so later calls skip the library checks
+_pos_fn = _first_position
+_POS_SOURCE = None  # Name of the library _pos_fn reads from
 
 
 def get_mouse_position():
     """Get mouse position using available library"""
-    if MOUSE_LIB == 'pyautogui':
-        try:
-            return pyautogui.position()
-        except Exception:
-            # Fallback to pynput if pyautogui fails
-            try:
-                from pynput import mouse
-                controller = mouse.Controller()
-                return controller.position
-            except Exception:
-                return (0, 0)
-    elif MOUSE_LIB == 'pynput':
-        try:
-            controller = mouse.Controller()
-            return controller.position
-        except Exception:
-            return (0, 0)
-    return (0, 0)
+    return _pos_fn()
+
+
+def position_source():
+    """Name of the library get_mouse_position() reads from"""
+    if _POS_SOURCE is None:
+        _resolve_position_fn()
+    return _POS_SOURCE
 
 
 class HighlightOverlay(QWidget):
@@ -68,6 +100,11 @@ class HighlightOverlay(QWidget):
             self.setGeometry(0, 0, 100, 100)
             self.highlight_size = 50
             self.highlight_color = QColor(255, 0, 0, 150)  # Red with transparency
+            self._pen = QPen(self.highlight_color, 3)
+            self._pixmap = None
+            self._last_pos = None  # Last (x, y) the overlay was centered on
+            self._build_path()
+            self._rebuild_pixmap()
             self.is_working = True
         except Exception as e:
             print(f"Warning: Overlay may not work properly: {e}")
@@ -76,20 +113,60 @@ class HighlightOverlay(QWidget):
     def set_highlight_size(self, size):
         """Set the size of the highlight circle"""
         self.highlight_size = size
+        self._build_path()
+        self._rebuild_pixmap()
         self.setGeometry(0, 0, size * 2, size * 2)
+        self.update(self._dirty_rect)
+        # Re-center on the last position; setGeometry moved it to the corner
+        if self._last_pos is not None:
+            x, y = self._last_pos
+            self._last_pos = None
+            self.update_position(x, y)
+        
+    def _build_path(self):
+        """Build the circle and crosshair as one path, drawn in a single call"""
+        size = self.highlight_size
+        center = size
+        hs, hs3 = size // 2, size // 3
+        path = QPainterPath()
+        path.addEllipse(center - hs, center - hs, size, size)
+        path.moveTo(center - hs3, center)
+        path.lineTo(center + hs3, center)
+        path.moveTo(center, center - hs3)
+        path.lineTo(center, center + hs3)
+        self._path = path
+        # Area actually drawn (circle plus pen width), used for repaints
+        self._dirty_rect = QRect(center - hs - 2, center - hs - 2,
+                                 size + 4, size + 4)
         
     def set_highlight_color(self, color):
         """Set the color of the highlight circle"""
         self.highlight_color = color
+        self._pen.setColor(color)
+        self._rebuild_pixmap()
+        self.update(self._dirty_rect)
+        
+    def _rebuild_pixmap(self):
+        """Pre-render the highlight once; paintEvent only blits it"""
+        size = self.highlight_size * 2
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pen)
+        painter.drawPath(self._path)
+        painter.end()
+        self._pixmap = pixmap
         
     def update_position(self, x, y):
         """Update the overlay position to center on mouse coordinates"""
-        if not self.is_working:
+        if not self.is_working or (x, y) == self._last_pos:
             return
+        self._last_pos = (x, y)
         try:
             half_size = self.highlight_size
+            # Content is unchanged by a move, so no repaint is requested
             self.move(int(x - half_size), int(y - half_size))
-            self.update()
         except Exception:
             pass
         
@@ -98,21 +175,10 @@ class HighlightOverlay(QWidget):
         if not self.is_working:
             return
         try:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # Draw outer circle
-            pen = QPen(self.highlight_color, 3)
-            painter.setPen(pen)
-            center = self.highlight_size
-            painter.drawEllipse(center - self.highlight_size//2, center - self.highlight_size//2, 
-                              self.highlight_size, self.highlight_size)
-            
-            # Draw crosshair
-            painter.drawLine(center - self.highlight_size//3, center, 
-                            center + self.highlight_size//3, center)
-            painter.drawLine(center, center - self.highlight_size//3, 
-                            center, center + self.highlight_size//3)
+            # Circle and crosshair are pre-rendered in _rebuild_pixmap;
+            # blit only the exposed part
+            rect = event.rect()
+            QPainter(self).drawPixmap(rect, self._pixmap, rect)
         except Exception:
             pass
 
@@ -126,24 +192,85 @@ class MouseCoordinateTracker(QMainWindow):
         self.current_y = 0
         self.tracking_enabled = False
         self.highlight_enabled = False
-        
-        # Create highlight overlay
-        self.overlay = HighlightOverlay()
+        self._overlay_shown = False  # Avoids an isVisible() call per tick
+        # Show/hide requests settle for 150 ms before the window is mapped
+        # or unmapped, so rapid toggles don't thrash the window manager
+        self._overlay_wanted = False
+        self._overlay_state_timer = QTimer(self)
+        self._overlay_state_timer.setSingleShot(True)
+        self._overlay_state_timer.timeout.connect(self._apply_overlay_state)
+        self._interval_ms = 50  # Mirrors freq_spinbox, updated on change
+        self._idle_ticks = 0  # Consecutive ticks without cursor movement
+        self._last_exc_type = None  # Last error type shown by update_coordinates
+        # Usable primary screen area, cached for centering the window
+        self._screen_geometry = QGuiApplication.primaryScreen().availableGeometry()
+        
+        # Highlight overlay (a top-level window) is created on first use
+        self.overlay = None
+        self._overlay_ok = True  # Cleared if creating the overlay fails
+        
+        # Debug lines that can't change during a session, built once
+        self._debug_static = (f"Display: {os.environ.get('DISPLAY', 'Not set')}\n"
+                              f"Python: {sys.version.split()[0]}")
+        self._last_debug = None
+        
+        # Event-driven position source: pynput's listener thread stores the
+        # latest position and the timer only reads it. Falls back to polling
+        # get_mouse_position() if the listener can't be started.
+        self._latest = None
+        self._listener = None
+        if MOUSE_LIB == 'pynput':
+            try:
+                self._latest = get_mouse_position()
+                listener = mouse.Listener(on_move=self._on_move)
+                listener.start()
+                # Listener.wait() blocks forever if the thread dies before it
+                # is ready (no X access, no XRecord), so wait with a timeout
+                with listener._condition:
+                    listener._condition.wait_for(
+                        lambda: listener._ready or not listener.is_alive(),
+                        timeout=1.0)
+                if not listener.is_alive():
+                    raise RuntimeError("listener thread exited on startup")
+                self._listener = listener
+            except Exception as e:
+                print(f"Warning: mouse listener unavailable, polling instead: {e}")
+                self._listener = None
         
         # Setup timer for coordinate updates
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_coordinates)
         
+        # Spinbox drags fire valueChanged per step; apply only the last value
+        self._pending_interval = self._interval_ms
+        self._freq_debounce = QTimer(self)
+        self._freq_debounce.setSingleShot(True)
+        self._freq_debounce.timeout.connect(self._apply_pending_interval)
+        self._pending_size = 50
+        self._size_debounce = QTimer(self)
+        self._size_debounce.setSingleShot(True)
+        self._size_debounce.timeout.connect(self._apply_pending_size)
+        
         self.init_ui()
         self.setup_timer()
         
         # Show library info
         self.show_library_info()
         
+    def _on_move(self, x, y):
+        """pynput callback (listener thread): keep only the newest position"""
+        self._latest = (x, y)
+        
+    def position_source(self):
+        """Name of the library the coordinates currently come from"""
+        if self._listener is not None:
+            return "pynput"
+        return position_source()
+        
     def show_library_info(self):
         """Show which mouse library is being used"""
-        lib_msg = f"Using {MOUSE_LIB} for mouse tracking"
-        if not self.overlay.is_working:
+        lib_msg = f"Using {self.position_source()} for mouse tracking"
+        if not self._overlay_ok:
             lib_msg += " (overlay disabled due to display issues)"
         self.status_label.setText(lib_msg)
         
@@ -168,7 +295,7 @@ class MouseCoordinateTracker(QMainWindow):
         coord_layout.addWidget(QLabel("X:"), 0, 0)
         self.x_label = QLabel("0")
         self.x_label.setFont(QFont("Courier", 16, QFont.Bold))
-        self.x_label.setStyleSheet("color: blue; background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc;")
+        self.x_label.setStyleSheet(COORD_LABEL_STYLE)
         self.x_label.setAlignment(Qt.AlignCenter)
         coord_layout.addWidget(self.x_label, 0, 1)
         
@@ -176,7 +303,7 @@ class MouseCoordinateTracker(QMainWindow):
         coord_layout.addWidget(QLabel("Y:"), 1, 0)
         self.y_label = QLabel("0")
         self.y_label.setFont(QFont("Courier", 16, QFont.Bold))
-        self.y_label.setStyleSheet("color: blue; background-color: #f0f0f0; padding: 5px; border: 1px solid #ccc;")
+        self.y_label.setStyleSheet(COORD_LABEL_STYLE)
         self.y_label.setAlignment(Qt.AlignCenter)
         coord_layout.addWidget(self.y_label, 1, 1)
         
@@ -190,7 +317,7 @@ class MouseCoordinateTracker(QMainWindow):
         button_layout = QHBoxLayout()
         self.start_button = QPushButton("Start Tracking")
         self.start_button.clicked.connect(self.toggle_tracking)
-        self.start_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 8px; }")
+        self.start_button.setStyleSheet(START_BUTTON_STYLE)
         button_layout.addWidget(self.start_button)
         
         self.copy_button = QPushButton("Copy Coordinates")
@@ -204,10 +331,6 @@ class MouseCoordinateTracker(QMainWindow):
         highlight_layout = QHBoxLayout()
         self.highlight_checkbox = QCheckBox("Enable Highlight")
         self.highlight_checkbox.toggled.connect(self.toggle_highlight)
-        # Disable if overlay doesn't work
-        if not self.overlay.is_working:
-            self.highlight_checkbox.setEnabled(False)
-            self.highlight_checkbox.setToolTip("Highlight disabled due to display compatibility issues")
         highlight_layout.addWidget(self.highlight_checkbox)
         
         highlight_layout.addWidget(QLabel("Size:"))
@@ -215,8 +338,6 @@ class MouseCoordinateTracker(QMainWindow):
         self.size_spinbox.setRange(20, 200)
         self.size_spinbox.setValue(50)
         self.size_spinbox.valueChanged.connect(self.update_highlight_size)
-        if not self.overlay.is_working:
-            self.size_spinbox.setEnabled(False)
         highlight_layout.addWidget(self.size_spinbox)
         
         control_layout.addLayout(highlight_layout)
@@ -256,29 +377,41 @@ class MouseCoordinateTracker(QMainWindow):
         
     def update_debug_info(self):
         """Update debug information display"""
-        debug_info = []
-        debug_info.append(f"Mouse Library: {MOUSE_LIB}")
-        debug_info.append(f"Overlay Working: {self.overlay.is_working}")
-        debug_info.append(f"Display: {os.environ.get('DISPLAY', 'Not set')}")
-        debug_info.append(f"Python: {sys.version.split()[0]}")
-        
-        self.debug_text.setText("\n".join(debug_info))
+        debug_text = (f"Mouse Library: {self.position_source()}\n"
+                      f"Overlay Working: {self._overlay_ok}\n"
+                      f"{self._debug_static}")
+        # QTextEdit.setText re-runs the rich-text layout; skip if unchanged
+        if debug_text != self._last_debug:
+            self._last_debug = debug_text
+            self.debug_text.setText(debug_text)
         
     def center_window(self):
         """Center the window on the screen"""
         try:
-            screen = QDesktopWidget().screenGeometry()
+            screen = self._screen_geometry
             size = self.geometry()
             self.move(
-                (screen.width() - size.width()) // 2,
-                (screen.height() - size.height()) // 2
+                screen.x() + (screen.width() - size.width()) // 2,
+                screen.y() + (screen.height() - size.height()) // 2
             )
         except Exception:
             pass  # If centering fails, just use default position
     
     def setup_timer(self):
         """Setup the timer with initial interval"""
-        self.timer.setInterval(50)  # 50ms = 20 FPS
+        self.timer.setInterval(self._interval_ms)  # 50ms = 20 FPS
+        self._apply_timer_type()
+        
+    def _apply_timer_type(self):
+        """Use a precise timer only for the overlay or sub-20 ms intervals"""
+        # Coarse timers may slip ~5%, which is fine for the labels but not
+        # for the overlay or the 10 ms end of the frequency spinbox
+        precise = self.highlight_enabled or self._interval_ms < 20
+        timer_type = Qt.PreciseTimer if precise else Qt.CoarseTimer
+        if timer_type != self.timer.timerType():
+            self.timer.setTimerType(timer_type)
+            if self.timer.isActive():
+                self.timer.start()  # Timer type only applies on (re)start
         
     def toggle_tracking(self):
         """Start or stop coordinate tracking"""
@@ -290,78 +423,174 @@ class MouseCoordinateTracker(QMainWindow):
     def start_tracking(self):
         """Start tracking mouse coordinates"""
         self.tracking_enabled = True
+        self._last_exc_type = None
         self.timer.start()
         self.start_button.setText("Stop Tracking")
-        self.start_button.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-weight: bold; padding: 8px; }")
+        self.start_button.setStyleSheet(STOP_BUTTON_STYLE)
         self.status_label.setText("Tracking mouse coordinates...")
         
     def stop_tracking(self):
         """Stop tracking mouse coordinates"""
         self.tracking_enabled = False
         self.timer.stop()
-        if self.highlight_enabled and self.overlay.is_working:
-            self.overlay.hide()
+        if self.highlight_enabled:
+            self._request_overlay(False)
         self.start_button.setText("Start Tracking")
-        self.start_button.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 8px; }")
+        self.start_button.setStyleSheet(START_BUTTON_STYLE)
         self.status_label.setText("Tracking stopped")
         
+    def _get_overlay(self):
+        """Create the highlight overlay on first use; None if it can't work"""
+        if self.overlay is None and self._overlay_ok:
+            overlay = HighlightOverlay()
+            if overlay.is_working:
+                size = self.size_spinbox.value()
+                if size != overlay.highlight_size:
+                    overlay.set_highlight_size(size)
+                self.overlay = overlay
+            else:
+                self._overlay_ok = False
+                self.highlight_checkbox.setEnabled(False)
+                self.highlight_checkbox.setToolTip("Highlight disabled due to display compatibility issues")
+                self.size_spinbox.setEnabled(False)
+                self.show_library_info()
+                self.update_debug_info()
+        return self.overlay
+        
     def toggle_highlight(self, checked):
         """Enable or disable mouse position highlighting"""
-        if not self.overlay.is_working:
+        if checked and self._get_overlay() is None:
+            self.highlight_checkbox.setChecked(False)
             return
         self.highlight_enabled = checked
+        self._apply_timer_type()
         if not checked:
-            self.overlay.hide()
+            self._request_overlay(False)
         elif self.tracking_enabled:
+            self._request_overlay(True)
+            
+    def _request_overlay(self, visible):
+        """Record the wanted overlay visibility and apply it once settled"""
+        self._overlay_wanted = visible
+        self._overlay_state_timer.start(150)
+        
+    def _apply_overlay_state(self):
+        """Show or hide the overlay if the settled state differs"""
+        if self.overlay is None or self._overlay_wanted == self._overlay_shown:
+            return
+        if self._overlay_wanted:
+            self.overlay.update_position(self.current_x, self.current_y)
             self.overlay.show()
+        else:
+            self.overlay.hide()
+        self._overlay_shown = self._overlay_wanted
             
     def update_highlight_size(self, size):
-        """Update the size of the highlight overlay"""
-        if self.overlay.is_working:
-            self.overlay.set_highlight_size(size)
+        """Update the size of the highlight overlay (debounced)"""
+        self._pending_size = size
+        self._size_debounce.start(120)
+        
+    def _apply_pending_size(self):
+        """Resize the overlay once the size spinbox settles"""
+        if self.overlay is not None:
+            self.overlay.set_highlight_size(self._pending_size)
         
     def update_timer_interval(self, interval):
-        """Update the timer interval for coordinate updates"""
-        if self.timer.isActive():
-            self.timer.setInterval(interval)
-        else:
-            self.timer.setInterval(interval)
+        """Update the timer interval for coordinate updates (debounced)"""
+        self._pending_interval = interval
+        self._freq_debounce.start(120)
+        
+    def _apply_pending_interval(self):
+        """Reprogram the update timer once the frequency spinbox settles"""
+        self._interval_ms = self._pending_interval
+        self._idle_ticks = 0
+        self.timer.setInterval(self._interval_ms)
+        self._apply_timer_type()
             
     def update_coordinates(self):
         """Update the displayed coordinates"""
         try:
             # Get current mouse position
-            x, y = get_mouse_position()
-            self.current_x = int(x)
-            self.current_y = int(y)
-            
-            # Update display
-            self.x_label.setText(str(self.current_x))
-            self.y_label.setText(str(self.current_y))
+            if self._listener is not None and not self._listener.is_alive():
+                # Listener thread died (X permissions, no XRecord, ...):
+                # poll instead so errors reach the status label
+                print("Warning: mouse listener stopped, polling instead")
+                self._listener = None
+                self.update_debug_info()
+            if self._listener is not None:
+                x, y = self._latest
+            else:
+                x, y = get_mouse_position()
+            x, y = int(x), int(y)
+            # Show before the unchanged check so an idle cursor still gets it
+            if self.highlight_enabled and not self._overlay_wanted:
+                self._request_overlay(True)
+            if x == self.current_x and y == self.current_y:
+                # Nothing to redraw; back off polling while the cursor is idle
+                self._idle_ticks += 1
+                if self._idle_ticks == 20:
+                    self.timer.setInterval(max(self._interval_ms, 200))
+                elif self._idle_ticks == 100:
+                    self.timer.setInterval(max(self._interval_ms, 500))
+                return
+            if self._idle_ticks >= 20:
+                # Only restore the interval once it was actually backed off
+                self.timer.setInterval(self._interval_ms)
+            self._idle_ticks = 0
+            # Update display; setText relayouts even for the same text, so
+            # only touch the label whose axis changed
+            if x != self.current_x:
+                self.current_x = x
+                self.x_label.setNum(x)
+            if y != self.current_y:
+                self.current_y = y
+                self.y_label.setNum(y)
             
             # Update highlight overlay if enabled
-            if self.highlight_enabled and self.overlay.is_working:
-                if not self.overlay.isVisible():
-                    self.overlay.show()
+            if self.highlight_enabled:
                 self.overlay.update_position(x, y)
                 
         except Exception as e:
-            self.status_label.setText(f"Error: {str(e)}")
+            # A persistent failure raises every tick; report each kind once
+            if type(e) is not self._last_exc_type:
+                self._last_exc_type = type(e)
+                self.status_label.setText(f"Error: {str(e)}")
             
     def copy_coordinates(self):
         """Copy current coordinates to clipboard"""
         coords_text = f"{self.current_x}, {self.current_y}"
+        # The X11 clipboard write can take tens of ms; run it once the
+        # current event has returned instead of inside the click handler
+        QTimer.singleShot(0, lambda: self._set_clipboard(coords_text))
+        self.status_label.setText(f"Copied coordinates: {coords_text}")
+        
+    def _set_clipboard(self, text):
+        """Write text to the clipboard, reporting failures in the status"""
         try:
-            QApplication.clipboard().setText(coords_text)
-            self.status_label.setText(f"Copied coordinates: {coords_text}")
+            QApplication.clipboard().setText(text)
         except Exception as e:
             self.status_label.setText(f"Error copying: {str(e)}")
         
+    def hideEvent(self, event):
+        """Pause polling while minimized/hidden, unless the overlay needs it"""
+        if self.tracking_enabled and not self.highlight_enabled:
+            self.timer.stop()
+        super().hideEvent(event)
+        
+    def showEvent(self, event):
+        """Resume polling when the window becomes visible again"""
+        if self.tracking_enabled and not self.timer.isActive():
+            self.timer.start()
+        super().showEvent(event)
+        
     def closeEvent(self, event):
         """Handle application close event"""
         if self.timer.isActive():
             self.timer.stop()
-        if self.overlay.is_working and self.overlay.isVisible():
+        self._overlay_state_timer.stop()
+        if self._listener is not None:
+            self._listener.stop()
+        if self.overlay is not None and self.overlay.isVisible():
             self.overlay.close()
         event.accept()
 
@@ -419,7 +648,7 @@ def main():
         window = MouseCoordinateTracker()
         window.show()
         
-        print(f"✅ GUI launched successfully using {MOUSE_LIB}")
+        print(f"✅ GUI launched successfully using {window.position_source()}")
         print("🎯 Click 'Start Tracking' to begin coordinate tracking")
         
         # Run application